@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+def compute_speaker_analytics(
+    segments: list[dict[str, Any]], diarization: list[dict[str, Any]] | None = None
+) -> list[dict[str, Any]]:
+    """Reduce speaker-labelled segments into per-speaker talk statistics.
+
+    Consecutive segments from the same speaker are merged into one turn.
+    Interruptions come from the raw diarization turns, since Whisper segments are
+    back to back and carry one label each: a diarization turn that starts before
+    the previous speaker's turn has ended counts against the speaker who cut in.
+    Without diarization there is nothing to detect overlap from, so it stays 0.
+    """
+
+    if not segments:
+        return []
+
+    try:
+        import numpy as np  # type: ignore
+    except Exception as e:  # noqa: BLE001
+        raise RuntimeError(
+            "NumPy is not installed. Install ML deps (see backend/requirements-ml.txt)."
+        ) from e
+
+    starts = np.fromiter((float(s.get("start", 0.0)) for s in segments), dtype=np.float64, count=len(segments))
+    ends = np.fromiter((float(s.get("end", 0.0)) for s in segments), dtype=np.float64, count=len(segments))
+    labels = np.array([s.get("speaker") or "Speaker 1" for s in segments])
+
+    order = np.argsort(starts, kind="stable")
+    starts, ends, labels = starts[order], np.maximum(ends[order], starts[order]), labels[order]
+
+    speakers, codes = np.unique(labels, return_inverse=True)
+    n = len(speakers)
+
+    talk_time = np.bincount(codes, weights=ends - starts, minlength=n)
+    segment_count = np.bincount(codes, minlength=n)
+
+    turn_first = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    turn_speaker = codes[turn_first]
+    turn_start = starts[turn_first]
+    turn_end = np.maximum.reduceat(ends, turn_first)
+    turn_len = turn_end - turn_start
+
+    turns = np.bincount(turn_speaker, minlength=n)
+    # Turn length spans first start to last end, gaps between a speaker's own
+    # segments included; average and longest turn both use it.
+    turn_time = np.bincount(turn_speaker, weights=turn_len, minlength=n)
+    longest_turn = np.zeros(n)
+    np.maximum.at(longest_turn, turn_speaker, turn_len)
+
+    interruptions = np.zeros(n, dtype=np.int64)
+    if diarization:
+        d_starts = np.fromiter((float(d["start"]) for d in diarization), dtype=np.float64, count=len(diarization))
+        d_ends = np.fromiter((float(d["end"]) for d in diarization), dtype=np.float64, count=len(diarization))
+        d_labels = np.array([str(d["speaker"]) for d in diarization])
+
+        d_order = np.argsort(d_starts, kind="stable")
+        d_starts, d_ends, d_labels = d_starts[d_order], d_ends[d_order], d_labels[d_order]
+
+        d_first = np.flatnonzero(np.r_[True, d_labels[1:] != d_labels[:-1]])
+        d_turn_start = d_starts[d_first]
+        d_turn_end = np.maximum.reduceat(d_ends, d_first)
+        d_turn_label = d_labels[d_first]
+
+        interrupting = d_turn_label[1:][d_turn_start[1:] < d_turn_end[:-1]]
+        # Map diarization labels onto the speakers seen in the transcript.
+        idx = np.clip(np.searchsorted(speakers, interrupting), 0, n - 1)
+        known = speakers[idx] == interrupting
+        interruptions = np.bincount(idx[known], minlength=n)
+
+    return [
+        {
+            "speaker": str(speakers[i]),
+            "talk_time_s": round(float(talk_time[i]), 3),
+            "segments": int(segment_count[i]),
+            "turns": int(turns[i]),
+            "turn_time_s": round(float(turn_time[i]), 3),
+            "avg_turn_s": round(float(turn_time[i] / turns[i]), 3) if turns[i] else 0.0,
+            "longest_turn_s": round(float(longest_turn[i]), 3),
+            "interruptions": int(interruptions[i]),
+        }
+        for i in range(n)
+    ]
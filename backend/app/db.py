@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import json
+import logging
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
+from .analytics import compute_speaker_analytics
 from .config import get_settings
 from .crypto import decrypt_json, encrypt_json
 from .storage import get_db_path
 
+logger = logging.getLogger(__name__)
+
 
 def _connect(db_path: Path) -> sqlite3.Connection:
     conn = sqlite3.connect(str(db_path))
@@ -33,6 +37,33 @@ def init_db() -> None:
             )
             """
         )
+        # One row per (recording, speaker), filled at processing time so dashboards
+        # never have to decrypt transcripts. created_at mirrors the recording's.
+        # The table is derived data: if its columns are out of date, rebuild it and
+        # let the backfill repopulate it.
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(speaker_analytics)")}
+        if columns and "turn_time_s" not in columns:
+            conn.execute("DROP TABLE speaker_analytics")
+            conn.execute("PRAGMA user_version = 0")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS speaker_analytics (
+              recording_id TEXT NOT NULL,
+              created_at TEXT NOT NULL,
+              speaker TEXT NOT NULL,
+              talk_time_s REAL NOT NULL,
+              segments INTEGER NOT NULL,
+              turns INTEGER NOT NULL,
+              turn_time_s REAL NOT NULL,
+              longest_turn_s REAL NOT NULL,
+              interruptions INTEGER NOT NULL,
+              PRIMARY KEY (recording_id, speaker)
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_speaker_analytics_created_at ON speaker_analytics(created_at)"
+        )
         conn.commit()
     finally:
         conn.close()
@@ -55,11 +86,54 @@ def insert_recording(*, recording_id: str, title: str, audio_path: str) -> None:
         conn.close()
 
 
+def insert_recordings(rows: Iterable[tuple[str, str, str, str]]) -> None:
+    """Register many (recording_id, title, created_at, audio_path) rows in one transaction."""
+
+    conn = _connect(get_db_path())
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT INTO recordings(id, title, created_at, audio_path) VALUES(?,?,?,?)",
+                rows,
+            )
+    finally:
+        conn.close()
+
+
+def _replace_speaker_analytics(
+    conn: sqlite3.Connection, recording_id: str, speaker_analytics: list[dict[str, Any]]
+) -> None:
+    conn.execute("DELETE FROM speaker_analytics WHERE recording_id=?", (recording_id,))
+    conn.executemany(
+        """
+        INSERT INTO speaker_analytics(
+          recording_id, created_at, speaker, talk_time_s, segments, turns, turn_time_s, longest_turn_s,
+          interruptions
+        )
+        SELECT id, created_at, ?, ?, ?, ?, ?, ?, ? FROM recordings WHERE id=?
+        """,
+        [
+            (
+                a["speaker"],
+                a["talk_time_s"],
+                a["segments"],
+                a["turns"],
+                a["turn_time_s"],
+                a["longest_turn_s"],
+                a["interruptions"],
+                recording_id,
+            )
+            for a in speaker_analytics
+        ],
+    )
+
+
 def update_processing_result(
     *,
     recording_id: str,
     transcript: dict[str, Any] | None,
     summary: dict[str, Any] | None,
+    speaker_analytics: list[dict[str, Any]] | None = None,
 ) -> None:
     settings = get_settings()
     conn = _connect(get_db_path())
@@ -91,11 +165,99 @@ def update_processing_result(
                 recording_id,
             ),
         )
+        if speaker_analytics is not None:
+            _replace_speaker_analytics(conn, recording_id, speaker_analytics)
         conn.commit()
     finally:
         conn.close()
 
 
+def _load_blob(value: str | None, passphrase: str) -> dict[str, Any] | None:
+    if not value:
+        return None
+    raw = json.loads(value)
+    if isinstance(raw, dict) and "_enc" in raw and passphrase:
+        return json.loads(decrypt_json(raw, passphrase))
+    return raw
+
+
+def _row_to_recording(row: sqlite3.Row, passphrase: str) -> dict[str, Any]:
+    return {
+        "id": row["id"],
+        "title": row["title"],
+        "created_at": row["created_at"],
+        "audio_path": row["audio_path"],
+        "transcript": _load_blob(row["transcript_json"], passphrase),
+        "summary": _load_blob(row["summary_json"], passphrase),
+    }
+
+
+def backfill_speaker_analytics() -> None:
+    """Compute speaker analytics for recordings processed before the table existed.
+
+    Meant to run in a background thread at startup. Each transcript is decrypted
+    once, outside any write transaction. The schema version is bumped to 1 only
+    after every candidate succeeded; otherwise the remaining recordings are
+    retried on the next startup.
+    """
+
+    settings = get_settings()
+    conn = _connect(get_db_path())
+    try:
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= 1:
+            return
+
+        recording_ids = [
+            row["id"]
+            for row in conn.execute(
+                """
+                SELECT id FROM recordings
+                WHERE transcript_json IS NOT NULL
+                  AND id NOT IN (SELECT DISTINCT recording_id FROM speaker_analytics)
+                """
+            )
+        ]
+        complete = True
+        for recording_id in recording_ids:
+            row = conn.execute("SELECT transcript_json FROM recordings WHERE id=?", (recording_id,)).fetchone()
+            if row is None or not row["transcript_json"]:
+                continue
+            try:
+                transcript = _load_blob(row["transcript_json"], settings.storage_passphrase) or {}
+                if "_enc" in transcript:
+                    raise RuntimeError("transcripts are encrypted and SIDECAR_STORAGE_PASSPHRASE is not set")
+                speaker_analytics = compute_speaker_analytics(
+                    transcript.get("segments") or [], transcript.get("diarization")
+                )
+            except RuntimeError as e:
+                # Missing passphrase or optional deps (NumPy, cryptography): retry on a later startup.
+                logger.warning("Speaker analytics backfill postponed: %s", e)
+                return
+            except Exception:  # noqa: BLE001
+                logger.exception("Speaker analytics backfill failed for recording %s", recording_id)
+                complete = False
+                continue
+
+            # Short write transaction per recording so live processing isn't blocked;
+            # skip recordings that were (re)processed while we were computing.
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if conn.execute(
+                    "SELECT 1 FROM speaker_analytics WHERE recording_id=? LIMIT 1", (recording_id,)
+                ).fetchone() is None:
+                    _replace_speaker_analytics(conn, recording_id, speaker_analytics)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        if complete:
+            conn.execute("PRAGMA user_version = 1")
+            conn.commit()
+    finally:
+        conn.close()
+
+
 def get_recording(recording_id: str) -> dict[str, Any] | None:
     settings = get_settings()
     conn = _connect(get_db_path())
@@ -103,29 +265,167 @@ def get_recording(recording_id: str) -> dict[str, Any] | None:
         row = conn.execute("SELECT * FROM recordings WHERE id=?", (recording_id,)).fetchone()
         if row is None:
             return None
+        return _row_to_recording(row, settings.storage_passphrase)
+    finally:
+        conn.close()
 
-        transcript = None
-        if row["transcript_json"]:
-            raw = json.loads(row["transcript_json"])
-            if isinstance(raw, dict) and "_enc" in raw and settings.storage_passphrase:
-                transcript = json.loads(decrypt_json(raw, settings.storage_passphrase))
-            else:
-                transcript = raw
 
-        summary = None
-        if row["summary_json"]:
-            raw = json.loads(row["summary_json"])
-            if isinstance(raw, dict) and "_enc" in raw and settings.storage_passphrase:
-                summary = json.loads(decrypt_json(raw, settings.storage_passphrase))
-            else:
-                summary = raw
-        return {
-            "id": row["id"],
-            "title": row["title"],
-            "created_at": row["created_at"],
-            "audio_path": row["audio_path"],
-            "transcript": transcript,
-            "summary": summary,
-        }
+def iter_recordings(recording_ids: list[str] | None = None) -> Iterator[dict[str, Any]]:
+    """Yield recordings, fetching them in small chunks.
+
+    With no ids, yields every recording ordered by creation time. Each chunk uses
+    its own short-lived connection, so the generator can be advanced from
+    different threads (as StreamingResponse does). A recording whose transcript
+    or summary can't be decoded is yielded without them and with an "error" key,
+    so one bad row doesn't end the iteration.
+    """
+
+    settings = get_settings()
+    if recording_ids is None:
+        conn = _connect(get_db_path())
+        try:
+            recording_ids = [
+                row["id"] for row in conn.execute("SELECT id FROM recordings ORDER BY created_at, id")
+            ]
+        finally:
+            conn.close()
+
+    # Chunk to stay under SQLite's bound-parameter limit and to bound memory.
+    for i in range(0, len(recording_ids), 100):
+        chunk = recording_ids[i : i + 100]
+        placeholders = ",".join("?" * len(chunk))
+        conn = _connect(get_db_path())
+        try:
+            rows = conn.execute(f"SELECT * FROM recordings WHERE id IN ({placeholders})", chunk).fetchall()
+        finally:
+            conn.close()
+        by_id = {row["id"]: row for row in rows}
+        for recording_id in chunk:
+            row = by_id.get(recording_id)
+            if row is None:
+                continue
+            try:
+                rec = _row_to_recording(row, settings.storage_passphrase)
+            except Exception as e:  # noqa: BLE001
+                logger.exception("Could not decode recording %s", recording_id)
+                rec = {
+                    "id": row["id"],
+                    "title": row["title"],
+                    "created_at": row["created_at"],
+                    "audio_path": row["audio_path"],
+                    "transcript": None,
+                    "summary": None,
+                    "error": f"{type(e).__name__}: {e}",
+                }
+            yield rec
+
+
+def _created_at_filter(start: str | None, end: str | None) -> tuple[str, list[Any]]:
+    clauses: list[str] = []
+    params: list[Any] = []
+    if start:
+        clauses.append("created_at >= ?")
+        params.append(start)
+    if end:
+        clauses.append("created_at < ?")
+        params.append(end)
+    return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+
+def aggregate_speaker_analytics(*, start: str | None, end: str | None) -> dict[str, Any]:
+    """Aggregate stored speaker analytics for recordings created in [start, end).
+
+    Returns the totals and a per-day trend. Speaker labels (pyannote's
+    SPEAKER_00, or "Speaker 1" without diarization) are assigned per recording
+    and don't identify the same person across meetings, so nothing here is
+    grouped by speaker; see list_recording_analytics for per-recording figures.
+    """
+
+    where, params = _created_at_filter(start, end)
+    conn = _connect(get_db_path())
+    try:
+        totals = conn.execute(
+            f"""
+            SELECT
+              COUNT(DISTINCT recording_id) AS recordings,
+              COALESCE(SUM(talk_time_s), 0) AS talk_time_s,
+              COALESCE(SUM(turns), 0) AS turns,
+              COALESCE(SUM(turn_time_s) / MAX(SUM(turns), 1), 0) AS avg_turn_s,
+              COALESCE(MAX(longest_turn_s), 0) AS longest_turn_s,
+              COALESCE(SUM(interruptions), 0) AS interruptions
+            FROM speaker_analytics {where}
+            """,
+            params,
+        ).fetchone()
+
+        trend = conn.execute(
+            f"""
+            SELECT
+              substr(created_at, 1, 10) AS day,
+              COUNT(DISTINCT recording_id) AS recordings,
+              SUM(talk_time_s) AS talk_time_s,
+              SUM(turns) AS turns,
+              SUM(turn_time_s) / MAX(SUM(turns), 1) AS avg_turn_s,
+              SUM(interruptions) AS interruptions
+            FROM speaker_analytics {where}
+            GROUP BY day
+            ORDER BY day
+            """,
+            params,
+        ).fetchall()
     finally:
         conn.close()
+
+    return {**dict(totals), "trend": [dict(row) for row in trend]}
+
+
+def list_recording_analytics(
+    *, start: str | None, end: str | None, limit: int, offset: int
+) -> dict[str, Any]:
+    """One summary row per recording created in [start, end), oldest first, paginated."""
+
+    where, params = _created_at_filter(start, end)
+    conn = _connect(get_db_path())
+    try:
+        total = conn.execute(
+            f"SELECT COUNT(DISTINCT recording_id) FROM speaker_analytics {where}", params
+        ).fetchone()[0]
+
+        rows = conn.execute(
+            f"""
+            WITH page AS (
+              SELECT DISTINCT recording_id, created_at
+              FROM speaker_analytics {where}
+              ORDER BY created_at, recording_id
+              LIMIT ? OFFSET ?
+            ),
+            ranked AS (
+              SELECT
+                sa.*,
+                ROW_NUMBER() OVER (PARTITION BY sa.recording_id ORDER BY sa.talk_time_s DESC, sa.speaker) AS rank
+              FROM speaker_analytics sa JOIN page USING (recording_id)
+            )
+            SELECT
+              ranked.recording_id,
+              r.title,
+              ranked.created_at,
+              COUNT(*) AS speakers,
+              SUM(ranked.talk_time_s) AS talk_time_s,
+              SUM(ranked.turns) AS turns,
+              SUM(ranked.turn_time_s) / MAX(SUM(ranked.turns), 1) AS avg_turn_s,
+              SUM(ranked.interruptions) AS interruptions,
+              MAX(CASE WHEN ranked.rank = 1 THEN ranked.speaker END) AS top_speaker,
+              COALESCE(
+                MAX(CASE WHEN ranked.rank = 1 THEN ranked.talk_time_s END) / NULLIF(SUM(ranked.talk_time_s), 0),
+                0
+              ) AS top_speaker_share
+            FROM ranked LEFT JOIN recordings r ON r.id = ranked.recording_id
+            GROUP BY ranked.recording_id
+            ORDER BY ranked.created_at, ranked.recording_id
+            """,
+            [*params, limit, offset],
+        ).fetchall()
+    finally:
+        conn.close()
+
+    return {"total": total, "limit": limit, "offset": offset, "recordings": [dict(row) for row in rows]}
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -12,13 +14,12 @@ class DiarizationSegment:
     speaker: str
 
 
-def diarize_wav(wav_path: Path) -> list[DiarizationSegment]:
-    """Optional diarization using pyannote.
+# The cached pipeline is shared across threads; run one diarization at a time.
+_PIPELINE_LOCK = threading.Lock()
 
-    This requires heavy ML deps and locally available model weights.
-    If pyannote isn't installed/configured, raise RuntimeError with a friendly message.
-    """
 
+@lru_cache(maxsize=1)
+def _load_pipeline(pipeline_ref: str, hf_token: str):
     try:
         from pyannote.audio import Pipeline  # type: ignore
     except Exception as e:  # noqa: BLE001
@@ -26,19 +27,27 @@ def diarize_wav(wav_path: Path) -> list[DiarizationSegment]:
             "Diarization is not installed. Install backend/requirements-diarization.txt and configure models."
         ) from e
 
+    if pipeline_ref:
+        return Pipeline.from_pretrained(pipeline_ref, use_auth_token=hf_token or None)
+    # Default reference; may require a token and may download weights if not cached.
+    return Pipeline.from_pretrained("pyannote/speaker-diarization@2.1", use_auth_token=hf_token or None)
+
+
+def diarize_wav(wav_path: Path) -> list[DiarizationSegment]:
+    """Optional diarization using pyannote.
+
+    This requires heavy ML deps and locally available model weights.
+    If pyannote isn't installed/configured, raise RuntimeError with a friendly message.
+    """
+
     # Users can point to a local pipeline via env var to avoid network calls.
     import os
 
     pipeline_ref = os.environ.get("SIDECAR_PYANNOTE_PIPELINE", "")
     hf_token = os.environ.get("PYANNOTE_AUTH_TOKEN", "")
-
-    if pipeline_ref:
-        pipeline = Pipeline.from_pretrained(pipeline_ref, use_auth_token=hf_token or None)
-    else:
-        # Default reference; may require a token and may download weights if not cached.
-        pipeline = Pipeline.from_pretrained("pyannote/speaker-diarization@2.1", use_auth_token=hf_token or None)
-
-    diarization = pipeline(str(wav_path))
+    with _PIPELINE_LOCK:
+        pipeline = _load_pipeline(pipeline_ref, hf_token)
+        diarization = pipeline(str(wav_path))
 
     segs: list[DiarizationSegment] = []
     for turn, _, speaker in diarization.itertracks(yield_label=True):
@@ -1,16 +1,37 @@
 from __future__ import annotations
 
+import io
+import json
+import logging
+import shutil
+import threading
 import uuid
+import zipfile
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any, Iterator, Optional
 
-from fastapi import FastAPI, File, Form, HTTPException, UploadFile
-from fastapi.responses import PlainTextResponse, Response
+from fastapi import BackgroundTasks, FastAPI, File, Form, HTTPException, Query, UploadFile
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from .db import get_recording, init_db, insert_recording, update_processing_result
+from .analytics import compute_speaker_analytics
+from .db import (
+    aggregate_speaker_analytics,
+    backfill_speaker_analytics,
+    get_recording,
+    init_db,
+    insert_recording,
+    insert_recordings,
+    iter_recordings,
+    list_recording_analytics,
+    update_processing_result,
+)
 from .processing import convert_to_wav_16k_mono, simple_summary, summarize_with_ollama, transcribe_with_whisper
 from .storage import get_recordings_dir
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(title="Side-Car Local Backend", version="0.1.0")
 
 app.add_middleware(
@@ -24,10 +45,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+AUDIO_SUFFIXES = {".webm", ".wav", ".mp3", ".m4a", ".ogg", ".opus", ".flac", ".aac", ".mp4", ".mkv"}
+
 
 @app.on_event("startup")
 def _startup() -> None:
     init_db()
+    # Decrypting every old transcript can take minutes; don't hold up startup.
+    threading.Thread(target=_backfill_speaker_analytics, name="speaker-analytics-backfill", daemon=True).start()
+
+
+def _backfill_speaker_analytics() -> None:
+    try:
+        backfill_speaker_analytics()
+    except Exception:  # noqa: BLE001
+        logger.exception("Speaker analytics backfill failed")
 
 
 @app.get("/health")
@@ -53,29 +85,259 @@ async def upload_recording(
     return {"id": recording_id, "audio_path": str(raw_path)}
 
 
+@app.post("/recordings/import")
+def import_recordings(
+    background_tasks: BackgroundTasks,
+    directory: Optional[str] = Form(None),
+    files: Optional[list[UploadFile]] = File(None),
+    process: bool = Form(True),
+):
+    """Register many recordings at once from a local directory and/or a multi-file upload.
+
+    All rows are inserted in a single transaction; processing (if requested) runs
+    in the background, one recording after another, reusing the loaded models.
+    """
+
+    sources: list[tuple[str, Any]] = []
+    if directory:
+        src_dir = Path(directory).expanduser()
+        if not src_dir.is_dir():
+            raise HTTPException(status_code=400, detail="Import directory not found")
+        for path in sorted(src_dir.iterdir()):
+            if path.is_file() and path.suffix.lower() in AUDIO_SUFFIXES:
+                sources.append((path.name, path))
+    for upload in files or []:
+        sources.append((upload.filename or "audio.webm", upload))
+
+    if not sources:
+        raise HTTPException(status_code=400, detail="No audio files to import")
+
+    recordings_dir = get_recordings_dir()
+    imported: list[dict[str, str]] = []
+    copied: list[Path] = []
+    try:
+        for name, src in sources:
+            recording_id = str(uuid.uuid4())
+            suffix = Path(name).suffix or ".webm"
+            raw_path = recordings_dir / f"{recording_id}{suffix}"
+
+            # Track before copying so a partially written file is removed too.
+            copied.append(raw_path)
+            if isinstance(src, Path):
+                shutil.copyfile(src, raw_path)
+            else:
+                with raw_path.open("wb") as out:
+                    shutil.copyfileobj(src.file, out)
+
+            # Keep an archive's original meeting dates: use the source file's mtime
+            # for directory imports. Uploads carry no reliable timestamp.
+            if isinstance(src, Path):
+                created = datetime.fromtimestamp(src.stat().st_mtime, tz=timezone.utc)
+            else:
+                created = datetime.now(timezone.utc)
+
+            imported.append(
+                {
+                    "id": recording_id,
+                    "title": Path(name).stem or "meeting",
+                    "created_at": created.isoformat(),
+                    "audio_path": str(raw_path),
+                }
+            )
+
+        insert_recordings((r["id"], r["title"], r["created_at"], r["audio_path"]) for r in imported)
+    except Exception:
+        # Nothing was committed; don't leave orphaned audio behind.
+        for path in copied:
+            path.unlink(missing_ok=True)
+        raise
+
+    if process:
+        background_tasks.add_task(_process_many, [r["id"] for r in imported])
+
+    return {"recordings": imported, "processing": process}
+
+
+@app.get("/recordings/export")
+def export_recordings(
+    ids: Optional[list[str]] = Query(None),
+    formats: str = "txt,md,json",
+):
+    """Stream a ZIP of many recordings without building the archive in memory.
+
+    With no `ids`, every recording is exported.
+    """
+
+    wanted = [f.strip() for f in formats.split(",") if f.strip()]
+    unknown = [f for f in wanted if f not in ("txt", "md", "json")]
+    if not wanted or unknown:
+        raise HTTPException(status_code=400, detail="Unknown export format")
+
+    return StreamingResponse(
+        _zip_recordings(ids, wanted),
+        media_type="application/zip",
+        headers={"Content-Disposition": "attachment; filename=\"recordings.zip\""},
+    )
+
+
+def _process(rec: dict[str, Any]) -> dict[str, Any]:
+    raw_path = Path(rec["audio_path"])
+    wav_path = raw_path.with_suffix(".wav")
+
+    convert_to_wav_16k_mono(raw_path, wav_path)
+    transcript = transcribe_with_whisper(wav_path)
+    text = transcript.get("text") or ""
+    summary = summarize_with_ollama(text) or simple_summary(text)
+    speaker_analytics = compute_speaker_analytics(
+        transcript.get("segments") or [], transcript.get("diarization")
+    )
+
+    update_processing_result(
+        recording_id=rec["id"],
+        transcript=transcript,
+        summary=summary,
+        speaker_analytics=speaker_analytics,
+    )
+
+    return {"id": rec["id"], "transcript": transcript, "summary": summary}
+
+
+def _process_many(recording_ids: list[str]) -> None:
+    failed: list[str] = []
+    for recording_id in recording_ids:
+        try:
+            rec = get_recording(recording_id)
+            if rec is None:
+                continue
+            _process(rec)
+        except Exception:  # noqa: BLE001
+            # One bad file shouldn't stop the rest of the batch; it stays unprocessed.
+            logger.exception("Batch processing failed for recording %s", recording_id)
+            failed.append(recording_id)
+
+    if failed:
+        logger.warning("Batch processing finished with %d of %d failed: %s", len(failed), len(recording_ids), failed)
+
+
+class _ZipSink(io.RawIOBase):
+    """Unseekable write target that hands written bytes back to the response stream."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _render_entries(rec: dict[str, Any], formats: list[str]) -> list[tuple[str, str]]:
+    base = f"{rec['id']}/{_safe_title(rec['title'])}"
+    entries: list[tuple[str, str]] = []
+    for fmt in formats:
+        if fmt == "txt":
+            entries.append((f"{base}.txt", _render_txt(rec)))
+        elif fmt == "md":
+            entries.append((f"{base}.md", _render_md(rec)))
+        else:
+            entries.append((f"{base}.json", json.dumps(rec, ensure_ascii=False, indent=2)))
+    return entries
+
+
+def _zip_recordings(recording_ids: list[str] | None, formats: list[str]) -> Iterator[bytes]:
+    sink = _ZipSink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for rec in iter_recordings(recording_ids):
+            # The 200 is already sent, so a failure must not abort the stream: record
+            # it in the archive and keep going so the central directory gets written.
+            error = rec.get("error")
+            if not error:
+                try:
+                    entries = _render_entries(rec, formats)
+                except Exception as e:  # noqa: BLE001
+                    logger.exception("Bulk export failed for recording %s", rec["id"])
+                    error = f"{type(e).__name__}: {e}"
+            if error:
+                entries = [(f"{rec['id']}/ERROR.txt", f"Export failed for {rec['title']!r}: {error}\n")]
+            for name, body in entries:
+                zf.writestr(name, body)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    # Central directory is written on close.
+    yield sink.drain()
+
+
 @app.post("/recordings/{recording_id}/process")
 def process_recording(recording_id: str):
     rec = get_recording(recording_id)
     if rec is None:
         raise HTTPException(status_code=404, detail="Recording not found")
 
-    raw_path = Path(rec["audio_path"])
-    wav_path = raw_path.with_suffix(".wav")
-
     try:
-        convert_to_wav_16k_mono(raw_path, wav_path)
-        transcript = transcribe_with_whisper(wav_path)
-        text = transcript.get("text") or ""
-        summary = summarize_with_ollama(text) or simple_summary(text)
-
-        update_processing_result(recording_id=recording_id, transcript=transcript, summary=summary)
-
-        return {"id": recording_id, "transcript": transcript, "summary": summary}
+        return _process(rec)
     except RuntimeError as e:
         # Keep failure message user-friendly.
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
+def _parse_bound(value: str | None, *, end: bool) -> str | None:
+    # Normalise to the UTC isoformat used for created_at so SQLite can compare strings.
+    # A bare date (any form date.fromisoformat accepts) as the upper bound includes
+    # that whole day.
+    if not value:
+        return None
+    try:
+        day = date.fromisoformat(value)
+    except ValueError:
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid date: {value}") from e
+    else:
+        dt = datetime(day.year, day.month, day.day)
+        if end:
+            dt += timedelta(days=1)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).isoformat()
+
+
+@app.get("/analytics")
+def get_analytics(
+    from_: Optional[str] = Query(None, alias="from"),
+    to: Optional[str] = None,
+):
+    """Totals and per-day trend for recordings created between `from` and `to`.
+
+    Nothing is grouped by speaker label, because labels aren't stable across
+    meetings; per-recording figures are paged via /analytics/recordings.
+    """
+
+    start = _parse_bound(from_, end=False)
+    end = _parse_bound(to, end=True)
+    return {"from": from_, "to": to, **aggregate_speaker_analytics(start=start, end=end)}
+
+
+@app.get("/analytics/recordings")
+def get_recording_analytics(
+    from_: Optional[str] = Query(None, alias="from"),
+    to: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+):
+    start = _parse_bound(from_, end=False)
+    end = _parse_bound(to, end=True)
+    return {"from": from_, "to": to, **list_recording_analytics(start=start, end=end, limit=limit, offset=offset)}
+
+
 @app.get("/recordings/{recording_id}")
 def get_recording_detail(recording_id: str):
     rec = get_recording(recording_id)
@@ -84,6 +346,50 @@ def get_recording_detail(recording_id: str):
     return rec
 
 
+def _safe_title(title: str) -> str:
+    return "".join(ch if ch.isalnum() or ch in (" ", "-", "_") else "_" for ch in title).strip() or "meeting"
+
+
+def _render_txt(rec: dict[str, Any]) -> str:
+    transcript_text = (rec.get("transcript") or {}).get("text") or ""
+    summary = rec.get("summary") or {}
+    return "\n".join(
+        [
+            rec["title"],
+            "",
+            "Summary:",
+            *[f"- {b}" for b in summary.get("bullets") or []],
+            "",
+            "Action items:",
+            *[f"- {a}" for a in summary.get("action_items") or []],
+            "",
+            "Transcript:",
+            transcript_text,
+            "",
+        ]
+    )
+
+
+def _render_md(rec: dict[str, Any]) -> str:
+    transcript_text = (rec.get("transcript") or {}).get("text") or ""
+    summary = rec.get("summary") or {}
+    return "\n".join(
+        [
+            f"# {rec['title']}",
+            "",
+            "## Summary",
+            *[f"- {b}" for b in summary.get("bullets") or []],
+            "",
+            "## Action items",
+            *[f"- {a}" for a in summary.get("action_items") or []],
+            "",
+            "## Transcript",
+            transcript_text,
+            "",
+        ]
+    )
+
+
 @app.get("/recordings/{recording_id}/export")
 def export_recording(recording_id: str, format: str = "txt"):
     rec = get_recording(recording_id)
@@ -96,47 +402,17 @@ def export_recording(recording_id: str, format: str = "txt"):
     bullets = summary.get("bullets") or []
     action_items = summary.get("action_items") or []
 
-    safe_title = "".join(ch if ch.isalnum() or ch in (" ", "-", "_") else "_" for ch in title).strip() or "meeting"
+    safe_title = _safe_title(title)
 
     if format == "txt":
-        body = "\n".join(
-            [
-                title,
-                "",
-                "Summary:",
-                *[f"- {b}" for b in bullets],
-                "",
-                "Action items:",
-                *[f"- {a}" for a in action_items],
-                "",
-                "Transcript:",
-                transcript_text,
-                "",
-            ]
-        )
         return PlainTextResponse(
-            body,
+            _render_txt(rec),
             headers={"Content-Disposition": f"attachment; filename=\"{safe_title}.txt\""},
         )
 
     if format == "md":
-        body = "\n".join(
-            [
-                f"# {title}",
-                "",
-                "## Summary",
-                *[f"- {b}" for b in bullets],
-                "",
-                "## Action items",
-                *[f"- {a}" for a in action_items],
-                "",
-                "## Transcript",
-                transcript_text,
-                "",
-            ]
-        )
         return PlainTextResponse(
-            body,
+            _render_md(rec),
             headers={"Content-Disposition": f"attachment; filename=\"{safe_title}.md\""},
         )
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import shutil
 import subprocess
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -44,12 +46,15 @@ def convert_to_wav_16k_mono(input_path: Path, output_path: Path) -> None:
         raise RuntimeError(f"ffmpeg failed: {proc.stderr.strip()}")
 
 
-def transcribe_with_whisper(wav_path: Path) -> dict[str, Any]:
-    """Attempts to run Whisper locally.
+# The cached model is shared by every request and background import; Whisper's
+# decoder attaches per-call hooks to the model, so calls must not overlap.
+_WHISPER_LOCK = threading.Lock()
 
-    If Whisper isn't installed, returns a clear error that the frontend can show.
-    """
 
+@lru_cache(maxsize=1)
+def _load_whisper_model(model_name: str):
+    # Loading weights dominates per-file cost; keep one instance per process so
+    # batch imports reuse it across recordings.
     try:
         import whisper  # type: ignore
     except Exception as e:  # noqa: BLE001
@@ -57,14 +62,24 @@ def transcribe_with_whisper(wav_path: Path) -> dict[str, Any]:
             "Whisper is not installed. Install ML deps (see backend/requirements-ml.txt)."
         ) from e
 
+    return whisper.load_model(model_name)
+
+
+def transcribe_with_whisper(wav_path: Path) -> dict[str, Any]:
+    """Attempts to run Whisper locally.
+
+    If Whisper isn't installed, returns a clear error that the frontend can show.
+    """
+
     settings = get_settings()
-    model = whisper.load_model(settings.whisper_model)
-    result = model.transcribe(
-        str(wav_path),
-        language=settings.whisper_language,
-        task="transcribe",
-        fp16=False,
-    )
+    with _WHISPER_LOCK:
+        model = _load_whisper_model(settings.whisper_model)
+        result = model.transcribe(
+            str(wav_path),
+            language=settings.whisper_language,
+            task="transcribe",
+            fp16=False,
+        )
 
     # Normalize to a stable minimal format.
     segments: list[dict[str, Any]] = []
@@ -80,9 +95,13 @@ def transcribe_with_whisper(wav_path: Path) -> dict[str, Any]:
     # Optional diarization (offline, but heavy deps). Enable with SIDECAR_DIARIZATION=1
     import os
 
+    diarization: list[dict[str, Any]] = []
     if os.environ.get("SIDECAR_DIARIZATION", "").strip() in ("1", "true", "yes"):
         diar = diarize_wav(wav_path)
         segments = assign_speakers_to_whisper_segments(segments, diar)
+        # Kept alongside the labelled segments: unlike them, diarization turns can
+        # overlap, which is what speaker analytics uses to detect interruptions.
+        diarization = [{"start": d.start, "end": d.end, "speaker": d.speaker} for d in diar]
     else:
         # Default: single-speaker label
         segments = [{**s, "speaker": "Speaker 1"} for s in segments]
@@ -91,6 +110,7 @@ def transcribe_with_whisper(wav_path: Path) -> dict[str, Any]:
         "language": result.get("language"),
         "text": (result.get("text") or "").strip(),
         "segments": segments,
+        "diarization": diarization,
     }
 
 
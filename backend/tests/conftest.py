@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    path = tmp_path / "data"
+    monkeypatch.setenv("SIDECAR_DATA_DIR", str(path))
+    monkeypatch.delenv("SIDECAR_STORAGE_PASSPHRASE", raising=False)
+    return path
+
+
+@pytest.fixture
+def client(data_dir):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with TestClient(app) as c:
+        yield c
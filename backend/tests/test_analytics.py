@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from app.analytics import compute_speaker_analytics
+
+
+def _by_speaker(segments):
+    return {row["speaker"]: row for row in compute_speaker_analytics(segments)}
+
+
+def test_empty_segments():
+    assert compute_speaker_analytics([]) == []
+
+
+def test_back_to_back_handoffs_are_not_interruptions():
+    stats = _by_speaker(
+        [
+            {"start": 0.0, "end": 2.0, "speaker": "A"},
+            {"start": 2.0, "end": 3.0, "speaker": "B"},
+            {"start": 3.0, "end": 5.0, "speaker": "A"},
+        ]
+    )
+
+    assert stats["A"]["interruptions"] == 0
+    assert stats["B"]["interruptions"] == 0
+    assert stats["A"]["turns"] == 2
+    assert stats["B"]["turns"] == 1
+
+
+def test_back_to_back_whisper_segments_without_diarization_have_no_interruptions():
+    # Whisper emits contiguous segments: each starts exactly where the last ended.
+    stats = _by_speaker(
+        [
+            {"start": 0.0, "end": 3.2, "speaker": "SPEAKER_00"},
+            {"start": 3.2, "end": 5.9, "speaker": "SPEAKER_01"},
+            {"start": 5.9, "end": 8.4, "speaker": "SPEAKER_00"},
+            {"start": 8.4, "end": 10.0, "speaker": "SPEAKER_01"},
+        ]
+    )
+
+    assert stats["SPEAKER_00"]["interruptions"] == 0
+    assert stats["SPEAKER_01"]["interruptions"] == 0
+
+
+def test_interruptions_come_from_overlapping_diarization_turns():
+    segments = [
+        {"start": 0.0, "end": 3.2, "speaker": "SPEAKER_00"},
+        {"start": 3.2, "end": 5.9, "speaker": "SPEAKER_01"},
+        {"start": 5.9, "end": 8.4, "speaker": "SPEAKER_00"},
+        {"start": 8.4, "end": 10.0, "speaker": "SPEAKER_01"},
+    ]
+    diarization = [
+        # SPEAKER_01 cuts in before SPEAKER_00 has finished.
+        {"start": 0.1, "end": 3.6, "speaker": "SPEAKER_00"},
+        {"start": 3.1, "end": 5.8, "speaker": "SPEAKER_01"},
+        # Clean handoff after a pause.
+        {"start": 6.0, "end": 8.3, "speaker": "SPEAKER_00"},
+        # SPEAKER_01 cuts in again.
+        {"start": 8.1, "end": 10.0, "speaker": "SPEAKER_01"},
+    ]
+
+    stats = {row["speaker"]: row for row in compute_speaker_analytics(segments, diarization)}
+
+    assert stats["SPEAKER_01"]["interruptions"] == 2
+    assert stats["SPEAKER_00"]["interruptions"] == 0
+
+
+def test_diarization_speaker_without_transcript_segments_is_ignored():
+    segments = [{"start": 0.0, "end": 4.0, "speaker": "SPEAKER_00"}]
+    diarization = [
+        {"start": 0.0, "end": 4.0, "speaker": "SPEAKER_00"},
+        {"start": 2.0, "end": 2.5, "speaker": "SPEAKER_02"},
+    ]
+
+    stats = {row["speaker"]: row for row in compute_speaker_analytics(segments, diarization)}
+
+    assert list(stats) == ["SPEAKER_00"]
+    assert stats["SPEAKER_00"]["interruptions"] == 0
+
+
+def test_consecutive_segments_merge_into_one_turn():
+    stats = _by_speaker(
+        [
+            {"start": 0.0, "end": 2.0, "speaker": "A"},
+            {"start": 2.1, "end": 5.0, "speaker": "A"},
+            {"start": 5.1, "end": 6.0, "speaker": "B"},
+        ]
+    )
+
+    assert stats["A"]["segments"] == 2
+    assert stats["A"]["turns"] == 1
+    assert stats["A"]["talk_time_s"] == pytest.approx(4.9)
+    assert stats["A"]["longest_turn_s"] == pytest.approx(5.0)
+    assert stats["A"]["turn_time_s"] == pytest.approx(5.0)
+    assert stats["A"]["avg_turn_s"] == pytest.approx(5.0)
+
+
+def test_missing_speaker_defaults_to_single_speaker():
+    stats = _by_speaker([{"start": 0.0, "end": 1.0}, {"start": 1.0, "end": 2.0}])
+
+    assert list(stats) == ["Speaker 1"]
+    assert stats["Speaker 1"]["turns"] == 1
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from app import db
+from app.analytics import compute_speaker_analytics
+
+TWO_SPEAKERS = [
+    {"start": 0.0, "end": 2.0, "speaker": "A"},
+    {"start": 2.0, "end": 8.0, "speaker": "B"},
+]
+ONE_SPEAKER = [{"start": 0.0, "end": 4.0, "speaker": "A"}]
+
+
+def _seed(rows):
+    db.insert_recordings((rid, rid, created_at, f"/audio/{rid}.wav") for rid, created_at, _ in rows)
+    for rid, _, segments in rows:
+        db.update_processing_result(
+            recording_id=rid,
+            transcript={"text": "", "segments": segments},
+            summary=None,
+            speaker_analytics=compute_speaker_analytics(segments),
+        )
+
+
+@pytest.fixture
+def seeded(client):
+    _seed(
+        [
+            ("r1", "2025-01-01T10:00:00+00:00", TWO_SPEAKERS),
+            ("r2", "2025-01-02T23:59:59+00:00", ONE_SPEAKER),
+            ("r3", "2025-01-03T00:00:00+00:00", ONE_SPEAKER),
+        ]
+    )
+    return client
+
+
+def test_analytics_totals_and_trend(seeded):
+    body = seeded.get("/analytics").json()
+
+    assert body["recordings"] == 3
+    assert body["talk_time_s"] == pytest.approx(16.0)
+    assert body["turns"] == 4
+    assert body["avg_turn_s"] == pytest.approx(4.0)
+    assert body["longest_turn_s"] == pytest.approx(6.0)
+    assert "speakers" not in body
+    assert body["trend"] == [
+        {"day": "2025-01-01", "recordings": 1, "talk_time_s": 8.0, "turns": 2, "avg_turn_s": 4.0, "interruptions": 0},
+        {"day": "2025-01-02", "recordings": 1, "talk_time_s": 4.0, "turns": 1, "avg_turn_s": 4.0, "interruptions": 0},
+        {"day": "2025-01-03", "recordings": 1, "talk_time_s": 4.0, "turns": 1, "avg_turn_s": 4.0, "interruptions": 0},
+    ]
+
+
+@pytest.mark.parametrize(
+    "params, expected",
+    [
+        ({"from": "2025-01-02"}, 2),
+        ({"to": "2025-01-02"}, 2),
+        ({"to": "20250102"}, 2),
+        ({"from": "2025-01-01", "to": "2025-01-01"}, 1),
+        ({"to": "2025-01-03T00:00:00+00:00"}, 2),
+        ({"from": "2025-01-03T01:00:00+01:00"}, 1),
+        ({"from": "2025-01-04"}, 0),
+    ],
+)
+def test_analytics_date_bounds_are_half_open(seeded, params, expected):
+    assert seeded.get("/analytics", params=params).json()["recordings"] == expected
+
+
+def test_analytics_rejects_invalid_date(seeded):
+    assert seeded.get("/analytics", params={"from": "yesterday"}).status_code == 400
+
+
+def test_recording_analytics_are_paginated_with_top_speaker_share(seeded):
+    first = seeded.get("/analytics/recordings", params={"limit": 2}).json()
+
+    assert first["total"] == 3
+    assert [r["recording_id"] for r in first["recordings"]] == ["r1", "r2"]
+    r1 = first["recordings"][0]
+    assert r1["speakers"] == 2
+    assert r1["top_speaker"] == "B"
+    assert r1["top_speaker_share"] == pytest.approx(0.75)
+    assert first["recordings"][1]["top_speaker_share"] == pytest.approx(1.0)
+
+    rest = seeded.get("/analytics/recordings", params={"limit": 2, "offset": 2}).json()
+    assert [r["recording_id"] for r in rest["recordings"]] == ["r3"]
+
+    assert seeded.get("/analytics/recordings", params={"limit": 0}).status_code == 422
+
+
+def _raw_recording(data_dir, recording_id, transcript_json):
+    db.insert_recordings([(recording_id, recording_id, "2025-01-01T00:00:00+00:00", "/audio.wav")])
+    conn = sqlite3.connect(data_dir / "sidecar.sqlite3")
+    conn.execute("UPDATE recordings SET transcript_json=? WHERE id=?", (transcript_json, recording_id))
+    conn.commit()
+    conn.close()
+
+
+def _user_version(data_dir):
+    conn = sqlite3.connect(data_dir / "sidecar.sqlite3")
+    try:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _analysed(data_dir):
+    conn = sqlite3.connect(data_dir / "sidecar.sqlite3")
+    try:
+        return {row[0] for row in conn.execute("SELECT DISTINCT recording_id FROM speaker_analytics")}
+    finally:
+        conn.close()
+
+
+def test_backfill_fills_existing_recordings_once(data_dir):
+    db.init_db()
+    _raw_recording(data_dir, "old", json.dumps({"segments": TWO_SPEAKERS}))
+
+    db.backfill_speaker_analytics()
+
+    assert _analysed(data_dir) == {"old"}
+    assert _user_version(data_dir) == 1
+    assert db.aggregate_speaker_analytics(start=None, end=None)["talk_time_s"] == pytest.approx(8.0)
+
+
+def test_backfill_postpones_encrypted_transcripts_without_passphrase(data_dir):
+    db.init_db()
+    _raw_recording(data_dir, "enc", json.dumps({"_enc": {"algo": "x"}}))
+
+    db.backfill_speaker_analytics()
+
+    assert _analysed(data_dir) == set()
+    assert _user_version(data_dir) == 0
+
+
+def test_backfill_retries_failed_recordings_on_next_run(data_dir):
+    db.init_db()
+    _raw_recording(data_dir, "good", json.dumps({"segments": ONE_SPEAKER}))
+    _raw_recording(data_dir, "bad", "{not json")
+
+    db.backfill_speaker_analytics()
+    assert _analysed(data_dir) == {"good"}
+    assert _user_version(data_dir) == 0
+
+    conn = sqlite3.connect(data_dir / "sidecar.sqlite3")
+    conn.execute("UPDATE recordings SET transcript_json=? WHERE id='bad'", (json.dumps({"segments": ONE_SPEAKER}),))
+    conn.commit()
+    conn.close()
+
+    db.backfill_speaker_analytics()
+    assert _analysed(data_dir) == {"good", "bad"}
+    assert _user_version(data_dir) == 1
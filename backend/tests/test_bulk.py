@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import io
+import os
+import sqlite3
+import zipfile
+from datetime import datetime, timezone
+
+import pytest
+
+
+def _import(client, **data):
+    return client.post("/recordings/import", data={"process": "false", **data})
+
+
+def test_directory_import_filters_suffixes_and_keeps_mtime(client, data_dir, tmp_path):
+    src = tmp_path / "archive"
+    src.mkdir()
+    (src / "standup.wav").write_bytes(b"wav")
+    (src / "retro.MP3").write_bytes(b"mp3")
+    (src / "notes.txt").write_text("not audio")
+    mtime = datetime(2025, 3, 4, 10, 30, tzinfo=timezone.utc).timestamp()
+    os.utime(src / "standup.wav", (mtime, mtime))
+
+    resp = _import(client, directory=str(src))
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["processing"] is False
+    by_title = {r["title"]: r for r in body["recordings"]}
+    assert set(by_title) == {"standup", "retro"}
+    assert by_title["standup"]["created_at"] == "2025-03-04T10:30:00+00:00"
+    for rec in body["recordings"]:
+        assert os.path.exists(rec["audio_path"])
+        assert client.get(f"/recordings/{rec['id']}").json()["created_at"] == rec["created_at"]
+
+
+def test_multipart_import(client):
+    resp = client.post(
+        "/recordings/import",
+        data={"process": "false"},
+        files=[
+            ("files", ("one.webm", b"aaa", "audio/webm")),
+            ("files", ("two.m4a", b"bbbb", "audio/mp4")),
+        ],
+    )
+
+    assert resp.status_code == 200
+    recordings = resp.json()["recordings"]
+    assert [r["title"] for r in recordings] == ["one", "two"]
+    assert [open(r["audio_path"], "rb").read() for r in recordings] == [b"aaa", b"bbbb"]
+
+
+def test_import_rejects_empty_input(client, tmp_path):
+    (tmp_path / "only.txt").write_text("x")
+
+    assert _import(client).status_code == 400
+    assert _import(client, directory=str(tmp_path)).status_code == 400
+    assert _import(client, directory=str(tmp_path / "missing")).status_code == 400
+
+
+def test_import_removes_copied_audio_when_insert_fails(client, data_dir, tmp_path, monkeypatch):
+    import app.main
+
+    def fail(rows):
+        list(rows)
+        raise sqlite3.IntegrityError("boom")
+
+    monkeypatch.setattr(app.main, "insert_recordings", fail)
+    src = tmp_path / "archive"
+    src.mkdir()
+    (src / "a.wav").write_bytes(b"a")
+    (src / "b.wav").write_bytes(b"b")
+
+    with pytest.raises(sqlite3.IntegrityError):
+        _import(client, directory=str(src))
+
+    assert list((data_dir / "recordings").iterdir()) == []
+
+
+def test_bulk_export_streams_valid_zip(client, tmp_path):
+    src = tmp_path / "archive"
+    src.mkdir()
+    (src / "standup.wav").write_bytes(b"a")
+    (src / "retro.wav").write_bytes(b"b")
+    recordings = _import(client, directory=str(src)).json()["recordings"]
+    ids = {r["title"]: r["id"] for r in recordings}
+
+    resp = client.get("/recordings/export", params={"formats": "txt,json"})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/zip"
+    names = set(zipfile.ZipFile(io.BytesIO(resp.content)).namelist())
+    assert names == {
+        f"{ids['standup']}/standup.txt",
+        f"{ids['standup']}/standup.json",
+        f"{ids['retro']}/retro.txt",
+        f"{ids['retro']}/retro.json",
+    }
+
+    resp = client.get("/recordings/export", params={"ids": [ids["retro"]], "formats": "md"})
+    assert zipfile.ZipFile(io.BytesIO(resp.content)).namelist() == [f"{ids['retro']}/retro.md"]
+
+
+def test_bulk_export_writes_error_entry_for_undecodable_recording(client, data_dir, tmp_path):
+    src = tmp_path / "archive"
+    src.mkdir()
+    (src / "ok.wav").write_bytes(b"a")
+    (src / "bad.wav").write_bytes(b"b")
+    ids = {r["title"]: r["id"] for r in _import(client, directory=str(src)).json()["recordings"]}
+    conn = sqlite3.connect(data_dir / "sidecar.sqlite3")
+    conn.execute("UPDATE recordings SET transcript_json='{not json' WHERE id=?", (ids["bad"],))
+    conn.commit()
+    conn.close()
+
+    resp = client.get("/recordings/export", params={"formats": "txt"})
+
+    names = set(zipfile.ZipFile(io.BytesIO(resp.content)).namelist())
+    assert names == {f"{ids['ok']}/ok.txt", f"{ids['bad']}/ERROR.txt"}
+
+
+def test_bulk_export_rejects_unknown_formats(client):
+    assert client.get("/recordings/export", params={"formats": "txt,pdf"}).status_code == 400
+    assert client.get("/recordings/export", params={"formats": ","}).status_code == 400
+
+
+def test_zip_sink_is_unseekable_and_produces_valid_archive():
+    pytest.importorskip("fastapi")
+    from app.main import _ZipSink
+
+    sink = _ZipSink()
+    assert not sink.seekable()
+    parts = []
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for i in range(3):
+            zf.writestr(f"{i}/entry.txt", "hello " * 100)
+            parts.append(sink.drain())
+    parts.append(sink.drain())
+
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(parts)))
+    assert archive.testzip() is None
+    assert archive.namelist() == ["0/entry.txt", "1/entry.txt", "2/entry.txt"]